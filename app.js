@@ -69,11 +69,34 @@ async function loadIndex(){
   INDEX = Array.isArray(idx) ? idx.filter(x=>x && x.date).sort((a,b)=>a.date.localeCompare(b.date)) : [];
 }
 
+const DAY_CACHE = new Map(); // dateStr -> papers; past days never change
+
 async function loadDate(dateStr){
   els.content.textContent = "Loading…";
-  const data = await fetchJSON(`paper_json/${dateStr}.json`);
+  let data = DAY_CACHE.get(dateStr);
+  if(data === undefined){
+    data = await fetchJSON(`paper_json/${dateStr}.json`);
+    // The latest day can still be rewritten by the fetch job; only
+    // memoize days that are already final.
+    const latest = INDEX.length ? INDEX[INDEX.length - 1].date : null;
+    if(Array.isArray(data) && dateStr !== latest) DAY_CACHE.set(dateStr, data);
+  }
   ALL = Array.isArray(data) ? data : [];
   applyFilters();
+  prefetchNeighbors(dateStr);
+}
+
+function prefetchNeighbors(dateStr){
+  // Warm the cache for prev/next in parallel so arrow navigation is
+  // instant; fire-and-forget, failures just fall back to a normal load.
+  const latest = INDEX.length ? INDEX[INDEX.length - 1].date : null;
+  for(const dir of [-1, +1]){
+    const n = findNeighborDate(dateStr, dir);
+    if(!n || n === latest || DAY_CACHE.has(n)) continue;
+    fetchJSON(`paper_json/${n}.json`).then(data => {
+      if(Array.isArray(data)) DAY_CACHE.set(n, data);
+    });
+  }
 }
 
 /** ============================ FILTERS =============================== **/
@@ -86,18 +109,21 @@ function getActiveTerms(){
   return [...quotes, ...singles, ...chipActives].filter(Boolean);
 }
 
-function textMatches(paper, terms, titleOnly){
-  if(terms.length === 0) return true;
-  const title = normalize(paper.title);
-  const summary = normalize(paper.summary);
-  const hay = titleOnly ? title : (title + " " + summary);
-  return terms.every(term => {
+function compileTerms(terms){
+  // Unquote + lowercase each term once per filter run, not once per paper.
+  return terms.map(term => {
     term = term.trim();
-    if(!term) return true;
+    if(!term) return null;
     const quoted = term.startsWith('"') && term.endsWith('"');
-    const needle = normalize(quoted ? term.slice(1,-1) : term);
-    return hay.includes(needle);
-  });
+    return normalize(quoted ? term.slice(1,-1) : term);
+  }).filter(Boolean);
+}
+
+function textMatches(paper, needles, titleOnly){
+  if(needles.length === 0) return true;
+  const title = normalize(paper.title);
+  const hay = titleOnly ? title : (title + " " + normalize(paper.summary));
+  return needles.every(needle => hay.includes(needle));
 }
 
 function categoryMatches(paper, allowed){
@@ -148,12 +174,12 @@ function render(papers, dateStr){
 
 /** =========================== APPLY FILTERS ========================== **/
 function applyFilters(){
-  const terms = getActiveTerms();
+  const needles = compileTerms(getActiveTerms());
   const titleOnly = els.titleOnly.checked;
   const cats = getAllowedCats();
   const filtered = ALL.filter(p =>
     categoryMatches(p, cats) &&
-    textMatches(p, terms, titleOnly)
+    textMatches(p, needles, titleOnly)
   );
   render(filtered, els.date.value || "(no date)");
 }
@@ -16,51 +16,49 @@ dominated by fresh submissions.
 from __future__ import annotations
 
 import argparse
-import json
-import time
-import xml.etree.ElementTree as ET
+import asyncio
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
-import requests
+import aiohttp
+import orjson
+from lxml import etree as ET
 from zoneinfo import ZoneInfo
 
 from fetch_papers import (
-    ARXIV_API,
     CATEGORIES,
     ET_TZ,
-    NS,
-    _user_agent,
+    Paper,
+    _get_with_retries,
+    api_session,
+    atomic_write_bytes,
+    iter_parsed_entries,
+    load_index,
+    merge_index,
     parse_atom_date,
-    parse_entry,
-    save_index,
+    update_index,
+    write_index,
 )
 
 
-def _get(params, max_tries: int = 15, pause: float = 30.0) -> str:
-    headers = {"User-Agent": _user_agent()}
-    last = None
-    for i in range(max_tries):
-        try:
-            r = requests.get(ARXIV_API, params=params, headers=headers, timeout=60)
-            if r.status_code in (429, 503):
-                last = f"HTTP {r.status_code}"
-                # Capped backoff: 30, 60, 120, 240, 240, ...
-                wait = min(pause * (2 ** i), 240.0)
-                print(f"  [rate-limited] sleeping {wait:.0f}s (attempt {i+1}/{max_tries})", flush=True)
-                time.sleep(wait)
-                continue
-            r.raise_for_status()
-            return r.text
-        except Exception as e:
-            last = e
-            time.sleep(pause)
-    raise RuntimeError(f"arXiv API failed after {max_tries} tries: {last!r}")
+# One parser reused across OAI pages (all parsing happens on the event-loop
+# thread): no per-call parser setup, and collect_ids=False skips building
+# the xml:id hash we never consult. Atom pages stream through
+# iter_parsed_entries instead.
+_XML_PARSER = ET.XMLParser(collect_ids=False, huge_tree=False)
+
 
+async def fetch_window(session: aiohttp.ClientSession, category: str,
+                       start_dt: datetime, end_dt: datetime,
+                       page_size: int = 200, page_cap: int = 15):
+    """
+    Fetch all Paper records for `category` with submittedDate in
+    [start_dt, end_dt].
 
-def fetch_window(category: str, start_dt: datetime, end_dt: datetime,
-                 page_size: int = 200, page_cap: int = 15, polite_sleep: float = 3.0):
-    """Fetch all entries for `category` with submittedDate in [start_dt, end_dt]."""
+    Categories run as concurrent tasks; fetch_papers' shared semaphore and
+    min-interval limiter keep the overall request rate polite, so the old
+    per-page time.sleep() politeness delays are gone.
+    """
     s = start_dt.strftime("%Y%m%d%H%M")
     e = end_dt.strftime("%Y%m%d%H%M")
     query = f"cat:{category} AND submittedDate:[{s} TO {e}]"
@@ -73,33 +71,116 @@ def fetch_window(category: str, start_dt: datetime, end_dt: datetime,
             "start": i * page_size,
             "max_results": page_size,
         }
-        xml_text = _get(params)
-        root = ET.fromstring(xml_text)
-        batch = root.findall("atom:entry", NS)
+        xml_bytes = await _get_with_retries(session, params)
+        # Stream-parse: entries are freed as they are consumed, so peak
+        # memory per page is one entry, not the whole DOM.
+        batch = list(iter_parsed_entries(xml_bytes))
         out.extend(batch)
         if len(batch) < page_size:
             break
-        time.sleep(polite_sleep)
     print(f"  [{category}] window {s}-{e}: {len(out)} entries")
     return out
 
 
-def bucket_by_et_date(entries):
-    """Return {date: [parsed_entry, ...]} keyed by ET date of <updated>."""
-    buckets: dict[date, list[dict]] = {}
-    for e in entries:
-        upd_el = e.find("atom:updated", NS)
-        pub_el = e.find("atom:published", NS)
-        upd = (upd_el.text if upd_el is not None and upd_el.text else "").strip()
-        pub = (pub_el.text if pub_el is not None and pub_el.text else "").strip()
-        dt = parse_atom_date(upd) or parse_atom_date(pub)
+def bucket_by_et_date(papers):
+    """Return {date: [Paper, ...]} keyed by ET date of the updated field."""
+    buckets: dict[date, list[Paper]] = {}
+    for p in papers:
+        dt = parse_atom_date(p.updated) or parse_atom_date(p.published)
         if dt is None:
             continue
         d = dt.astimezone(ET_TZ).date()
-        buckets.setdefault(d, []).append(parse_entry(e))
+        buckets.setdefault(d, []).append(p)
     return buckets
 
 
+OAI_API = "https://export.arxiv.org/oai2"
+_OAI = "{http://www.openarchives.org/OAI/2.0/}"
+_AX = "{http://arxiv.org/OAI/arXiv/}"
+
+
+def _oai_sets(categories: list[str]) -> list[str]:
+    """OAI sets are archives ('cs'), not subcategories ('cs.CV')."""
+    return sorted({c.split(".")[0] for c in categories})
+
+
+def _parse_oai_record(rec):
+    """Map one OAI <record> to (datestamp, Paper), or None."""
+    header = rec.find(_OAI + "header")
+    if header is None or header.get("status") == "deleted":
+        return None
+    meta = rec.find(f"{_OAI}metadata/{_AX}arXiv")
+    if meta is None:
+        return None
+    datestamp = (header.findtext(_OAI + "datestamp") or "").strip()
+    aid = (meta.findtext(_AX + "id") or "").strip()
+    if not datestamp or not aid:
+        return None
+    created = (meta.findtext(_AX + "created") or "").strip()
+    updated = (meta.findtext(_AX + "updated") or "").strip() or created
+    authors = []
+    for a in meta.iterfind(f"{_AX}authors/{_AX}author"):
+        forenames = (a.findtext(_AX + "forenames") or "").strip()
+        keyname = (a.findtext(_AX + "keyname") or "").strip()
+        authors.append(" ".join(p for p in (forenames, keyname) if p))
+    entry = Paper(
+        id=f"http://arxiv.org/abs/{aid}",
+        title=" ".join((meta.findtext(_AX + "title") or "").split()),
+        summary=(meta.findtext(_AX + "abstract") or "").strip(),
+        published=created,
+        updated=updated,
+        link=f"http://arxiv.org/pdf/{aid}.pdf",
+        category=(meta.findtext(_AX + "categories") or "").split(),
+        authors=authors,
+    )
+    return datestamp, entry
+
+
+async def fetch_oai_records(session: aiohttp.ClientSession, set_spec: str,
+                            start: date, end: date):
+    """
+    Harvest ListRecords for one set with from=/until=, following
+    resumptionToken pages. One request returns up to ~1000 records, so a
+    long range costs far fewer round-trips than per-category paging.
+    Token pages are inherently sequential, but sets run concurrently.
+    """
+    params = {
+        "verb": "ListRecords",
+        "metadataPrefix": "arXiv",
+        "set": set_spec,
+        "from": str(start),
+        "until": str(end),
+    }
+    out = []
+    while True:
+        root = ET.fromstring(await _get_with_retries(session, params, url=OAI_API),
+                             parser=_XML_PARSER)
+        err = root.find(_OAI + "error")
+        if err is not None:
+            code = err.get("code") or ""
+            if code == "noRecordsMatch":
+                # Empty window — not a failure.
+                break
+            # badResumptionToken (tokens expire during long backoffs),
+            # badArgument, etc.: abort rather than writing a truncated
+            # harvest as complete day files.
+            raise RuntimeError(
+                f"OAI error for set={set_spec}: {code or 'unknown'} "
+                f"({(err.text or '').strip()})"
+            )
+        for rec in root.iterfind(f"{_OAI}ListRecords/{_OAI}record"):
+            parsed = _parse_oai_record(rec)
+            if parsed is not None:
+                out.append(parsed)
+        token_el = root.find(f"{_OAI}ListRecords/{_OAI}resumptionToken")
+        token = (token_el.text or "").strip() if token_el is not None else ""
+        if not token:
+            break
+        params = {"verb": "ListRecords", "resumptionToken": token}
+    print(f"  [set={set_spec}] {start}..{end}: {len(out)} records")
+    return out
+
+
 def daterange(start: date, end: date):
     cur = start
     while cur <= end:
@@ -107,7 +188,72 @@ def daterange(start: date, end: date):
         cur += timedelta(days=1)
 
 
-def main():
+def write_day_file(out_dir: Path, d: date, day_papers: list[Paper],
+                   overwrite: bool) -> int | None:
+    """Write one day's file; return its count, or None if skipped."""
+    # Dedupe by id in one dict pass (papers can appear in multiple
+    # categories), same idiom as the daily fetch's dedup; duplicate ids
+    # carry identical entries, so which one wins doesn't matter.
+    deduped = list({e.id: e for e in day_papers}.values())
+
+    out_file = out_dir / f"{d}.json"
+    if out_file.exists() and not overwrite:
+        try:
+            existing = orjson.loads(out_file.read_bytes())
+        except Exception:
+            existing = []
+        if isinstance(existing, list) and len(existing) > 0:
+            print(f"  SKIP {out_file.name}: already has {len(existing)} papers")
+            return None
+
+    # orjson serializes Paper dataclasses natively; same indented layout
+    # as the daily fetch writes. Atomic + skip-if-unchanged, so a rerun
+    # over an already-backfilled range touches nothing on disk.
+    if atomic_write_bytes(out_file, orjson.dumps(deduped, option=orjson.OPT_INDENT_2)):
+        print(f"  WROTE {out_file.name}: {len(deduped)} papers")
+    else:
+        print(f"  UNCHANGED {out_file.name}: {len(deduped)} papers")
+    return len(deduped)
+
+
+async def backfill_via_oai(session: aiohttp.ClientSession, categories: list[str],
+                           start: date, end: date, out_dir: Path,
+                           index_path: Path, overwrite: bool):
+    """
+    Backfill from OAI-PMH instead of per-category query-API windows.
+
+    Records are bucketed by their OAI <datestamp> (the day arXiv announced
+    or last touched the record — a plain date, no time), then filtered to
+    the requested categories. Cheaper than query paging for long ranges,
+    at day-granularity rather than the ET-timestamp bucketing of the
+    query path.
+    """
+    wanted = set(categories)
+    buckets: dict[date, list[Paper]] = {}
+    harvests = await asyncio.gather(*[
+        fetch_oai_records(session, set_spec, start, end)
+        for set_spec in _oai_sets(categories)
+    ])
+    for records in harvests:
+        for datestamp, entry in records:
+            if not wanted.intersection(entry.category):
+                continue
+            try:
+                d = datetime.strptime(datestamp, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if start <= d <= end:
+                buckets.setdefault(d, []).append(entry)
+
+    counts: dict[str, int] = {}
+    for d in daterange(start, end):
+        count = write_day_file(out_dir, d, buckets.get(d, []), overwrite)
+        if count is not None:
+            counts[str(d)] = count
+    update_index(index_path, counts)
+
+
+async def main():
     p = argparse.ArgumentParser(description="Backfill arXiv day files in a range.")
     p.add_argument("--start", required=True, help="Inclusive start (YYYY-MM-DD, ET).")
     p.add_argument("--end", required=True, help="Inclusive end (YYYY-MM-DD, ET).")
@@ -119,7 +265,9 @@ def main():
                    help="Extra days before chunk_start to widen submittedDate filter.")
     p.add_argument("--overwrite", action="store_true",
                    help="Overwrite existing non-empty files (default: skip).")
-    p.add_argument("--polite-sleep", type=float, default=3.0)
+    p.add_argument("--oai", action="store_true",
+                   help="Harvest via OAI-PMH ListRecords (one from/until range "
+                        "per archive set) instead of per-category query windows.")
     args = p.parse_args()
 
     start = datetime.strptime(args.start, "%Y-%m-%d").date()
@@ -131,7 +279,26 @@ def main():
     out_dir.mkdir(exist_ok=True)
     index_path = out_dir / "index.json"
 
-    # Walk in chunk-sized windows; each chunk covers chunk_days ET days.
+    if args.oai:
+        async with api_session() as session:
+            await backfill_via_oai(session, args.categories, start, end,
+                                   out_dir, index_path, args.overwrite)
+        print("\nBackfill complete (OAI-PMH).")
+        return
+
+    # Read the index once up front; chunks merge into the in-memory copy
+    # and only write it back, instead of reloading it per update.
+    index = load_index(index_path)
+
+    async with api_session() as session:
+        # Walk in chunk-sized windows; each chunk covers chunk_days ET days.
+        await _run_chunks(session, args, start, end, out_dir, index_path, index)
+
+    print("\nBackfill complete.")
+
+
+async def _run_chunks(session, args, start: date, end: date, out_dir: Path,
+                      index_path: Path, index: list):
     chunk_start = start
     while chunk_start <= end:
         chunk_end = min(chunk_start + timedelta(days=args.chunk_days - 1), end)
@@ -151,43 +318,26 @@ def main():
         print(f"\n=== Chunk {chunk_start} → {chunk_end} "
               f"(UTC submittedDate {win_start_utc:%Y%m%d%H%M}–{win_end_utc:%Y%m%d%H%M}) ===")
 
-        all_entries = []
-        for cat in args.categories:
-            all_entries.extend(fetch_window(cat, win_start_utc, win_end_utc,
-                                            polite_sleep=args.polite_sleep))
-            time.sleep(args.polite_sleep)
-
-        buckets = bucket_by_et_date(all_entries)
+        batches = await asyncio.gather(*[
+            fetch_window(session, cat, win_start_utc, win_end_utc)
+            for cat in args.categories
+        ])
+        buckets = bucket_by_et_date([e for batch in batches for e in batch])
 
-        # Write per-day files for days that fall within [chunk_start, chunk_end].
+        # Write per-day files for days that fall within [chunk_start, chunk_end];
+        # fold their counts into index.json once per chunk instead of
+        # re-reading and rewriting the whole index for every single day.
+        counts: dict[str, int] = {}
         for d in daterange(chunk_start, chunk_end):
-            day_papers = buckets.get(d, [])
-            # Dedupe by id (papers can appear in multiple categories).
-            seen, deduped = set(), []
-            for e in day_papers:
-                if e["id"] not in seen:
-                    deduped.append(e)
-                    seen.add(e["id"])
-
-            out_file = out_dir / f"{d}.json"
-            if out_file.exists() and not args.overwrite:
-                try:
-                    existing = json.loads(out_file.read_text(encoding="utf-8"))
-                except Exception:
-                    existing = []
-                if isinstance(existing, list) and len(existing) > 0:
-                    print(f"  SKIP {out_file.name}: already has {len(existing)} papers")
-                    continue
-
-            out_file.write_text(json.dumps(deduped, indent=2, ensure_ascii=False),
-                                encoding="utf-8")
-            print(f"  WROTE {out_file.name}: {len(deduped)} papers")
-            save_index(index_path, str(d), len(deduped))
+            count = write_day_file(out_dir, d, buckets.get(d, []), args.overwrite)
+            if count is not None:
+                counts[str(d)] = count
+        if counts:
+            index = merge_index(index, counts)
+            write_index(index_path, index)
 
         chunk_start = chunk_end + timedelta(days=1)
 
-    print("\nBackfill complete.")
-
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
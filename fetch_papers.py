@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
 # fetch_papers.py — tracks arXiv daily announcement dates in America/New_York.
 import argparse
-import json
+import asyncio
+import bisect
+import hashlib
 import os
 import random
 import time
-import xml.etree.ElementTree as ET
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from io import BytesIO
 from pathlib import Path
+from urllib.parse import urlencode
 
-import requests
+import aiohttp
+import orjson
+from lxml import etree as ET
 from zoneinfo import ZoneInfo
 
 ARXIV_API = "https://export.arxiv.org/api/query"  # HTTPS
 NS = {"atom": "http://www.w3.org/2005/Atom"}
+ENTRY_TAG = f"{{{NS['atom']}}}entry"
+ID_TAG = f"{{{NS['atom']}}}id"
+TITLE_TAG = f"{{{NS['atom']}}}title"
+SUMMARY_TAG = f"{{{NS['atom']}}}summary"
+UPDATED_TAG = f"{{{NS['atom']}}}updated"
+PUBLISHED_TAG = f"{{{NS['atom']}}}published"
+CATEGORY_TAG = f"{{{NS['atom']}}}category"
+AUTHOR_TAG = f"{{{NS['atom']}}}author"
+NAME_TAG = f"{{{NS['atom']}}}name"
 ET_TZ = ZoneInfo("America/New_York")
 ANNOUNCEMENT_HOUR_ET = 20
 NO_ANNOUNCEMENT_WEEKDAYS = {4, 5}  # Friday, Saturday. Sunday-Thursday announce.
@@ -44,6 +59,19 @@ MAX_API_TRIES = _int_env("ARXIV_MAX_API_TRIES", 10)
 RETRY_BASE_SECONDS = _float_env("ARXIV_RETRY_BASE_SECONDS", 30.0)
 RATE_LIMIT_MIN_WAIT_SECONDS = _float_env("ARXIV_RATE_LIMIT_MIN_WAIT_SECONDS", 120.0)
 RETRY_JITTER_SECONDS = _float_env("ARXIV_RETRY_JITTER_SECONDS", 5.0)
+MAX_CONCURRENT_REQUESTS = _int_env("ARXIV_MAX_CONCURRENT_REQUESTS", 3)
+# Optional conditional-request cache; empty = off (a fresh CI runner has
+# nothing cached anyway, but reruns on a persistent machine get 304s).
+HTTP_CACHE_DIR = os.environ.get("ARXIV_HTTP_CACHE_DIR", "")
+# Per-(category, day) result cache so reruns skip the API entirely.
+DAY_CACHE_DIR = Path(os.environ.get("ARXIV_DAY_CACHE_DIR", ".arxiv_cache"))
+DAY_CACHE_FRESH_SECONDS = 24 * 3600
+DAY_CACHE_MAX_AGE_DAYS = 7
+
+# Created at import time; asyncio primitives bind to the running loop lazily
+# (Python >= 3.10), and this module only ever runs one loop via asyncio.run.
+_api_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+_rate_lock = asyncio.Lock()
 
 
 def _user_agent() -> str:
@@ -51,6 +79,23 @@ def _user_agent() -> str:
     return "daily-arxiv-fetch/0.6 (GitHub Actions; contact owner via repo issues)"
 
 
+def api_session() -> aiohttp.ClientSession:
+    """One ClientSession per run, shared by every request in it."""
+    # Explicit gzip: Atom feeds compress ~5-10x and the client
+    # decompresses transparently on Content-Encoding.
+    # The connector keeps a small pool of keep-alive connections to
+    # export.arxiv.org, so sequential pages reuse one TCP+TLS handshake
+    # instead of reconnecting per request.
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=60,
+        ),
+        headers={"User-Agent": _user_agent(), "Accept-Encoding": "gzip"},
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+    )
+
+
 def parse_atom_date(s: str) -> datetime | None:
     """Robust ISO-8601 parser for arXiv timestamps (e.g., '...Z' or '+00:00')."""
     if not s:
@@ -64,22 +109,130 @@ def parse_atom_date(s: str) -> datetime | None:
         return None
 
 
-def parse_entry(e):
-    arxiv_id = e.find("atom:id", NS).text
-    pdf_link = arxiv_id.replace("abs", "pdf") + ".pdf"
-    cats = [c.attrib.get("term") for c in e.findall("atom:category", NS)]
-    authors = [a.find("atom:name", NS).text for a in e.findall("atom:author", NS)]
+@dataclass(slots=True)
+class Paper:
+    """
+    One arXiv entry. Slotted, so a day's worth of entries carries fixed
+    attribute storage instead of a per-entry hash table; orjson serializes
+    dataclasses natively with these exact field names, so the JSON on disk
+    (what the frontend fetches) is unchanged.
+    """
+    id: str
+    title: str
+    summary: str
+    published: str
+    updated: str
+    link: str
+    category: list[str]
+    authors: list[str]
+
+
+def parse_entry(e, updated: str | None = None,
+                published: str | None = None) -> Paper:
+    """Build a Paper; timestamps already read by the caller can be passed in."""
+    # One pass over the entry's direct children, dispatching on the
+    # fully-qualified tag, instead of seven separate tree traversals.
+    arxiv_id = title = summary = ""
+    category: list[str] = []
+    authors: list[str] = []
+    for child in e:
+        tag = child.tag
+        if tag == ID_TAG:
+            arxiv_id = (child.text or "").strip()
+        elif tag == TITLE_TAG:
+            title = (child.text or "").strip()
+        elif tag == SUMMARY_TAG:
+            summary = (child.text or "").strip()
+        elif tag == PUBLISHED_TAG:
+            if published is None:
+                published = (child.text or "").strip()
+        elif tag == UPDATED_TAG:
+            if updated is None:
+                updated = (child.text or "").strip()
+        elif tag == CATEGORY_TAG:
+            term = child.get("term")
+            if term:
+                category.append(term)
+        elif tag == AUTHOR_TAG:
+            name = child.findtext(NAME_TAG)
+            if name:
+                authors.append(name.strip())
+
+    return Paper(
+        id=arxiv_id,
+        title=title,
+        summary=summary,
+        published=published or "",
+        updated=updated or "",
+        link=arxiv_id.replace("abs", "pdf") + ".pdf",
+        category=category,
+        authors=authors,
+    )
+
+
+def utc_bounds_for_et_day(day_et: date) -> tuple[str, str]:
+    """
+    UTC bounds [start, end) of an ET calendar day as 'YYYY-MM-DDTHH:MM:SSZ'.
+
+    arXiv Atom timestamps are canonical Zulu strings, which sort
+    chronologically, so "falls on this ET day" becomes two string
+    comparisons instead of a fromisoformat + astimezone per entry.
+    ZoneInfo computes the bounds, so DST days (23h/25h) stay exact.
+    """
+    start_et = datetime(day_et.year, day_et.month, day_et.day, tzinfo=ET_TZ)
+    end_et = start_et + timedelta(days=1)
+    fmt = "%Y-%m-%dT%H:%M:%SZ"
+    return (
+        start_et.astimezone(timezone.utc).strftime(fmt),
+        end_et.astimezone(timezone.utc).strftime(fmt),
+    )
+
+
+def _is_canonical_zulu(ts: str) -> bool:
+    return len(ts) == 20 and ts.endswith("Z")
 
-    return {
-        "id": arxiv_id,
-        "title": (e.find("atom:title", NS).text or "").strip(),
-        "summary": (e.find("atom:summary", NS).text or "").strip(),
-        "published": (e.find("atom:published", NS).text or "").strip(),
-        "updated": (e.find("atom:updated", NS).text or "").strip(),
-        "link": pdf_link,
-        "category": cats,
-        "authors": authors,
-    }
+
+def _parse_page(
+    xml_bytes: bytes, within: tuple[str, str] | None = None
+) -> tuple[list[Paper], int, str]:
+    """
+    Parse one Atom page; return (papers, raw entry count, oldest timestamp).
+
+    Each <entry> is cleared and detached from the tree as soon as it has
+    been consumed, so peak memory is one entry rather than the whole page.
+
+    With `within` = (lo, hi) UTC Zulu bounds, entries whose timestamp is
+    canonical and falls outside [lo, hi) are dropped after reading just
+    that one field — no Paper is built for them. Non-canonical timestamps
+    are kept for the caller's slower filter. The raw count and oldest
+    timestamp let the caller drive pagination and early termination.
+    """
+    papers: list[Paper] = []
+    n_entries = 0
+    oldest = ""
+    for _event, elem in ET.iterparse(BytesIO(xml_bytes), events=("end",), tag=ENTRY_TAG):
+        n_entries += 1
+        upd = (elem.findtext(UPDATED_TAG) or "").strip()
+        pub = (elem.findtext(PUBLISHED_TAG) or "").strip()
+        ts = upd or pub
+        oldest = ts
+        if (
+            within is None
+            or not _is_canonical_zulu(ts)
+            or within[0] <= ts < within[1]
+        ):
+            # Hand the timestamps over so parse_entry does not re-walk
+            # the children we just read them from.
+            papers.append(parse_entry(elem, updated=upd, published=pub))
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return papers, n_entries, oldest
+
+
+def iter_parsed_entries(xml_bytes: bytes):
+    """Parse one Atom page, yielding parse_entry() Paper records."""
+    yield from _parse_page(xml_bytes)[0]
 
 
 def has_announcement_day(announce_day_et: date) -> bool:
@@ -101,14 +254,16 @@ def default_announcement_day(now_et: datetime | None = None) -> date:
     return announce_day
 
 
-def _wait_for_rate_limit():
-    """Keep all arXiv API calls at least ~3 seconds apart."""
+async def _wait_for_rate_limit():
+    """Keep all arXiv API call *starts* at least MIN_API_INTERVAL_SECONDS apart."""
     global _last_api_request_at
-    now = time.monotonic()
-    elapsed = now - _last_api_request_at
-    if elapsed < MIN_API_INTERVAL_SECONDS:
-        time.sleep(MIN_API_INTERVAL_SECONDS - elapsed)
-    _last_api_request_at = time.monotonic()
+    async with _rate_lock:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        elapsed = now - _last_api_request_at
+        if elapsed < MIN_API_INTERVAL_SECONDS:
+            await asyncio.sleep(MIN_API_INTERVAL_SECONDS - elapsed)
+        _last_api_request_at = loop.time()
 
 
 def _retry_after_seconds(value: str | None) -> float | None:
@@ -124,50 +279,105 @@ def _response_snippet(text: str, limit: int = 300) -> str:
     return " ".join((text or "").split())[:limit]
 
 
-def _get_with_retries(
+def _cache_entry(params, url: str) -> tuple[Path, Path] | None:
+    """(meta, body) cache paths for one query, or None when caching is off."""
+    if not HTTP_CACHE_DIR:
+        return None
+    cache_dir = Path(HTTP_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    material = url + "?" + urlencode(sorted(params.items()))
+    key = hashlib.sha256(material.encode()).hexdigest()[:24]
+    return cache_dir / f"{key}.meta.json", cache_dir / f"{key}.xml"
+
+
+def _conditional_headers(cache) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if cache is None:
+        return headers
+    meta_path, body_path = cache
+    if not (meta_path.exists() and body_path.exists()):
+        return headers
+    try:
+        meta = orjson.loads(meta_path.read_bytes())
+    except Exception:
+        return headers
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _store_cache(cache, r, body: bytes):
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return  # nothing to validate against next time
+    meta_path, body_path = cache
+    body_path.write_bytes(body)
+    meta_path.write_bytes(
+        orjson.dumps({"etag": etag, "last_modified": last_modified})
+    )
+
+
+async def _get_with_retries(
+    session: aiohttp.ClientSession,
     params,
     max_tries: int = MAX_API_TRIES,
     pause: float = RETRY_BASE_SECONDS,
-) -> str:
-    headers = {"User-Agent": _user_agent()}
+    url: str = ARXIV_API,
+) -> bytes:
+    cache = _cache_entry(params, url)
+    cond_headers = _conditional_headers(cache)
     last_error = None
     for attempt in range(1, max_tries + 1):
         try:
-            _wait_for_rate_limit()
-            r = requests.get(
-                ARXIV_API,
-                params=params,
-                headers=headers,
-                timeout=REQUEST_TIMEOUT_SECONDS,
-            )
-            if r.status_code in RETRYABLE_STATUS_CODES:
-                snippet = _response_snippet(r.text)
-                last_error = f"HTTP {r.status_code}; response={snippet!r}; url={r.url}"
-                retry_after = _retry_after_seconds(r.headers.get("Retry-After"))
-                wait = (
-                    retry_after
-                    if retry_after is not None
-                    else min(pause * (2 ** (attempt - 1)), 180.0)
-                )
-                if r.status_code == 429:
-                    wait = max(wait, RATE_LIMIT_MIN_WAIT_SECONDS)
-                wait += random.uniform(0, RETRY_JITTER_SECONDS)
-                if attempt < max_tries:
-                    print(
-                        f"[WARN] arXiv API {last_error}; retrying in {wait:.0f}s "
-                        f"(attempt {attempt}/{max_tries})",
-                        flush=True,
-                    )
-                    time.sleep(wait)
-                    continue
+            async with _api_semaphore:
+                await _wait_for_rate_limit()
+                async with session.get(
+                    url, params=params, headers=cond_headers or None
+                ) as r:
+                    if r.status == 304 and cache is not None:
+                        # Feed unchanged; reuse the cached body.
+                        return cache[1].read_bytes()
+                    if r.status in RETRYABLE_STATUS_CODES:
+                        snippet = _response_snippet(await r.text())
+                        last_error = f"HTTP {r.status}; response={snippet!r}; url={r.url}"
+                        retry_after = _retry_after_seconds(r.headers.get("Retry-After"))
+                        wait = (
+                            retry_after
+                            if retry_after is not None
+                            else min(pause * (2 ** (attempt - 1)), 180.0)
+                        )
+                        if r.status == 429:
+                            wait = max(wait, RATE_LIMIT_MIN_WAIT_SECONDS)
+                        wait += random.uniform(0, RETRY_JITTER_SECONDS)
+                        if attempt < max_tries:
+                            print(
+                                f"[WARN] arXiv API {last_error}; retrying in {wait:.0f}s "
+                                f"(attempt {attempt}/{max_tries})",
+                                flush=True,
+                            )
+                        else:
+                            wait = None
+                    elif r.status >= 400:
+                        snippet = _response_snippet(await r.text())
+                        raise RuntimeError(
+                            f"arXiv API returned HTTP {r.status}: {snippet!r}; url={r.url}"
+                        )
+                    else:
+                        # Bytes: lxml decodes XML itself, skipping a
+                        # decode -> re-encode roundtrip through str.
+                        body = await r.read()
+                        if cache is not None:
+                            _store_cache(cache, r, body)
+                        return body
+            # Sleep outside the semaphore so a backing-off task does not
+            # block one of the few concurrent request slots.
+            if wait is None:
                 break
-            if r.status_code >= 400:
-                snippet = _response_snippet(r.text)
-                raise RuntimeError(
-                    f"arXiv API returned HTTP {r.status_code}: {snippet!r}; url={r.url}"
-                )
-            return r.text
-        except requests.RequestException as e:
+            await asyncio.sleep(wait)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             last_error = repr(e)
             wait = min(pause * (2 ** (attempt - 1)), 180.0)
             wait += random.uniform(0, RETRY_JITTER_SECONDS)
@@ -177,37 +387,65 @@ def _get_with_retries(
                     f"retrying in {wait:.0f}s (attempt {attempt}/{max_tries})",
                     flush=True,
                 )
-                time.sleep(wait)
+                await asyncio.sleep(wait)
                 continue
             break
     raise RuntimeError(f"arXiv API failed after {max_tries} attempts: {last_error}")
 
 
-def fetch_recent_desc(category: str, page_cap: int = 4, page_size: int = 200):
+async def fetch_recent_desc(
+    session: aiohttp.ClientSession,
+    categories: list[str],
+    page_cap: int | None = None,
+    page_size: int = 200,
+    window: tuple[str, str] | None = None,
+):
     """
-    Fetch recent entries for a category, **sorted by lastUpdatedDate desc**.
+    Fetch recent entries for all categories at once as Paper records,
+    **sorted by lastUpdatedDate desc**.
+
+    The categories collapse into a single boolean-OR search_query, so one
+    paged query replaces the old per-category fan-out (and de-dups
+    cross-listed papers server-side). Pages stay sequential: whether
+    another page exists is only known after the previous one is parsed.
+
+    If `window` = (lo, hi) is given, out-of-window entries are skipped at
+    parse time, and paging stops once the oldest entry on a page has fallen
+    before lo — with the descending sort every later page would be older
+    still, so those requests are pure waste.
     """
+    if page_cap is None:
+        page_cap = 4 * len(categories)  # same total budget as per-category paging
+    query = " OR ".join(f"cat:{c}" for c in categories)
     all_entries = []
     for i in range(page_cap):
         start = i * page_size
         params = {
-            "search_query": f"cat:{category}",
+            "search_query": query,
             "sortBy": "lastUpdatedDate",   # key change
             "sortOrder": "descending",
             "start": start,
             "max_results": page_size,
         }
-        xml_text = _get_with_retries(params)
-        root = ET.fromstring(xml_text)
-        batch = root.findall("atom:entry", NS)
+        xml_bytes = await _get_with_retries(session, params)
+        # Parse off the event loop: lxml holds the CPU for the whole page
+        # and releases the GIL in its C core, so a worker thread lets
+        # other in-flight requests keep flowing meanwhile.
+        batch, n_entries, oldest = await asyncio.get_running_loop().run_in_executor(
+            None, _parse_page, xml_bytes, window
+        )
         all_entries.extend(batch)
-        if len(batch) < page_size:
+        if n_entries < page_size:
+            break
+        if window is not None and oldest and oldest < window[0]:
             break
-    print(f"[DEBUG] {category}: fetched {len(all_entries)} (lastUpdatedDate desc)")
+    label = ",".join(categories)
+    print(f"[DEBUG] {label}: fetched {len(all_entries)} (lastUpdatedDate desc)")
     return all_entries
 
 
-def fetch_for_announce_day(category: str, announce_day_et):
+async def fetch_for_announce_day(session: aiohttp.ClientSession,
+                                 categories: list[str], announce_day_et):
     """
     Keep entries whose <updated> (or <published> fallback) falls on this
     *announcement calendar date in America/New_York*.
@@ -219,51 +457,149 @@ def fetch_for_announce_day(category: str, announce_day_et):
     else:
         target_date = announce_day_et  # assume it's already a date
 
-    entries = fetch_recent_desc(category)
+    label = ",".join(categories)
+    cached = load_day_cache(label, target_date)
+    if cached is not None:
+        print(f"[DEBUG] {label}: day-cache hit, {len(cached)} entries "
+              f"for announce_day_et={target_date}")
+        return cached
+
+    lo, hi = utc_bounds_for_et_day(target_date)
+    entries = await fetch_recent_desc(session, categories, window=(lo, hi))
     kept = []
 
     for e in entries:
-        upd_el = e.find("atom:updated", NS)
-        pub_el = e.find("atom:published", NS)
-
-        upd = (upd_el.text if upd_el is not None and upd_el.text else "").strip()
-        pub = (pub_el.text if pub_el is not None and pub_el.text else "").strip()
+        ts = e.updated or e.published
+        if _is_canonical_zulu(ts):
+            # Already window-checked at parse time by _parse_page.
+            kept.append(e)
+            continue
 
-        dt = parse_atom_date(upd) or parse_atom_date(pub)
+        # Unexpected format: fall back to full parsing + ET conversion.
+        dt = parse_atom_date(ts)
         if dt is None:
             continue
-
-        # Convert the timestamp to Eastern Time and compare the *date* only
-        dt_et = dt.astimezone(ET_TZ)
-        if dt_et.date() == target_date:
-            kept.append(parse_entry(e))
+        if dt.astimezone(ET_TZ).date() == target_date:
+            kept.append(e)
 
     print(
-        f"[DEBUG] {category}: kept {len(kept)} entries for announce_day_et={target_date}"
+        f"[DEBUG] {label}: kept {len(kept)} entries for announce_day_et={target_date}"
     )
+    store_day_cache(label, target_date, kept)
     return kept
 
 
+def _day_cache_path(category: str, day: date) -> Path:
+    return DAY_CACHE_DIR / f"{category}_{day}.json"
+
+
+def load_day_cache(category: str, day: date) -> list[Paper] | None:
+    """
+    Cached result of fetch_for_announce_day, or None.
+
+    arXiv announces once per day, so a past day's result is final and a
+    same-day result stays valid for 24h; reruns and manual backtests skip
+    the rate-limited API round trips entirely.
+    """
+    path = _day_cache_path(category, day)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    final = day < default_announcement_day()
+    if not final and time.time() - stat.st_mtime > DAY_CACHE_FRESH_SECONDS:
+        return None
+    try:
+        return [Paper(**d) for d in orjson.loads(path.read_bytes())]
+    except Exception:
+        return None
+
+
+def store_day_cache(category: str, day: date, papers: list[Paper]):
+    DAY_CACHE_DIR.mkdir(exist_ok=True)
+    _day_cache_path(category, day).write_bytes(orjson.dumps(papers))
+
+
+def prune_day_cache(max_age_days: int = DAY_CACHE_MAX_AGE_DAYS):
+    """Drop cache files old enough that no rerun will want them."""
+    if not DAY_CACHE_DIR.exists():
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for p in DAY_CACHE_DIR.iterdir():
+        try:
+            if p.stat().st_mtime < cutoff:
+                p.unlink()
+        except OSError:
+            pass
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> bool:
+    """
+    Write `data` to `path` via a same-directory temp file + os.replace, so
+    readers (and a crashed run) never see a half-written file. Skips the
+    write entirely when the content is unchanged, preserving the mtime
+    Pages-style deploys key off. Returns True if the file was replaced.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
 def load_index(index_path: Path):
     if not index_path.exists():
         return []
     try:
-        data = json.loads(index_path.read_text(encoding="utf-8"))
+        data = orjson.loads(index_path.read_bytes())
         return data if isinstance(data, list) else []
     except Exception:
         return []
 
 
+def merge_index(index: list, counts: dict[str, int]) -> list:
+    """Merge {date_str: count} entries into an in-memory index, date-sorted."""
+    index = [e for e in index if isinstance(e, dict) and e.get("date")]
+    dates = [e["date"] for e in index]
+    if dates != sorted(dates):  # only if the file was edited by hand
+        index.sort(key=lambda x: x["date"])
+        dates.sort()
+    for date_str in sorted(counts):
+        entry = {"date": date_str, "count": counts[date_str]}
+        # Bisect into the sorted list; the common daily case ("today" goes
+        # at the end) is O(log n) + append instead of a full re-sort.
+        pos = bisect.bisect_left(dates, date_str)
+        if pos < len(dates) and dates[pos] == date_str:
+            index[pos] = entry
+        else:
+            index.insert(pos, entry)
+            dates.insert(pos, date_str)
+    return index
+
+
+def write_index(index_path: Path, index: list):
+    # Compact on purpose: only the frontend's res.json() reads this file,
+    # and dropping the indent cuts it to roughly a third.
+    if atomic_write_bytes(index_path, orjson.dumps(index)):
+        print(f"[fetch_papers] Updated index: {index_path}")
+
+
+def update_index(index_path: Path, counts: dict[str, int]):
+    """Apply {date_str: count} entries with one load, one sort, one write."""
+    if not counts:
+        return
+    write_index(index_path, merge_index(load_index(index_path), counts))
+
+
 def save_index(index_path: Path, date_str: str, count: int):
-    index = load_index(index_path)
-    entry = {"date": date_str, "count": count}
-    index = [e for e in index if e.get("date") != date_str] + [entry]
-    index.sort(key=lambda x: x["date"])  # ascending
-    index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"[fetch_papers] Updated index: {index_path}")
+    update_index(index_path, {date_str: count})
 
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="Fetch arXiv issue by announcement day (ET).")
     parser.add_argument("--date", help="Announcement day in ET (YYYY-MM-DD). Default: today in ET.")
     parser.add_argument("--out-dir", default="paper_json", help="Output directory.")
@@ -275,6 +611,7 @@ def main():
 
     out_dir = Path(args.out_dir)
     out_dir.mkdir(exist_ok=True)
+    prune_day_cache()
 
     # Announcement day in ET
     if args.date:
@@ -283,27 +620,29 @@ def main():
         announce_day_et = default_announcement_day()
 
     # Gather
-    all_entries = []
+    batches = []
     if has_announcement_day(announce_day_et):
-        for cat in args.categories:
-            all_entries.extend(fetch_for_announce_day(cat, announce_day_et))
+        async with api_session() as session:
+            # One boolean-OR query covers every category.
+            batches = [
+                await fetch_for_announce_day(session, args.categories,
+                                             announce_day_et)
+            ]
     else:
         print(
             f"[fetch_papers] AnnounceDay(ET)={announce_day_et} has no arXiv "
             "announcement; writing an empty JSON file."
         )
 
-    # De-duplicate by id
-    seen, deduped = set(), []
-    for e in all_entries:
-        if e["id"] not in seen:
-            deduped.append(e)
-            seen.add(e["id"])
+    # De-duplicate by id in one pass; dicts preserve first-seen order.
+    deduped = list({e.id: e for batch in batches for e in batch}.values())
 
-    # Write daily file named by announcement day (ET)
+    # Write daily file named by announcement day (ET). Stays an indented
+    # JSON array (not NDJSON): the static frontend fetches these files
+    # directly with res.json(), and orjson emits UTF-8 like
+    # ensure_ascii=False did.
     out_file = out_dir / f"{announce_day_et}.json"
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(deduped, f, indent=2, ensure_ascii=False)
+    atomic_write_bytes(out_file, orjson.dumps(deduped, option=orjson.OPT_INDENT_2))
     print(f"[fetch_papers] AnnounceDay(ET)={announce_day_et} -> {len(deduped)} papers")
     print(f"[fetch_papers] Wrote: {out_file}")
 
@@ -312,4 +651,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
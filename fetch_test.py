@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Quick manual smoke test for the shared async fetch path.
+
+Grabs the most recent submissions for one category through the same
+aiohttp + lxml machinery fetch_papers.py uses (shared session, rate
+limiter, streaming parser) — no `arxiv` client dependency, no per-call
+politeness sleep beyond the shared limiter.
+
+Usage: python fetch_test.py --category cs.CV --max-results 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+import orjson
+
+from fetch_papers import _get_with_retries, api_session, iter_parsed_entries
+
+
+async def fetch_recent_papers(category: str, max_results: int):
+    params = {
+        "search_query": f"cat:{category}",
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+        "start": 0,
+        "max_results": max_results,
+    }
+    async with api_session() as session:
+        xml_bytes = await _get_with_retries(session, params)
+    return list(iter_parsed_entries(xml_bytes))
+
+
+async def main():
+    p = argparse.ArgumentParser(description="Fetch a few recent papers for one category.")
+    p.add_argument("--category", default="cs.CV")
+    p.add_argument("--max-results", type=int, default=10)
+    args = p.parse_args()
+
+    papers = await fetch_recent_papers(args.category, args.max_results)
+    # orjson serializes Paper dataclasses natively, same layout as the
+    # daily files.
+    sys.stdout.buffer.write(orjson.dumps(papers, option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
+    print(f"[fetch_test] {len(papers)} papers for cat:{args.category}",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())